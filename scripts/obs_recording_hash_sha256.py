@@ -1,29 +1,103 @@
 # OBS 31+ compatibility note: uses OBS 31+ frontend/event and property APIs only.
 
 import obspython as obs
+import io
 import os
 import csv
+import mmap
 import time
+import queue
+import sqlite3
 import threading
 import hashlib
-import datetime
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import watchfiles
+except ImportError:
+    watchfiles = None
+
+try:
+    import inotify_simple
+except ImportError:
+    inotify_simple = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
 
 # -----------------------------
 # Runtime settings and shared state
 # -----------------------------
-_SETTINGS = {
-    "hash_output_dir": "",
-    "csv_path": "",
-    "csv_delimiter": ",",
-    "retry_count": 5,
-    "retry_delay_ms": 400,
-}
-
-_seen_paths = set()
-_seen_lock = threading.Lock()
-_io_lock = threading.Lock()
-_loaded_csv_path = ""
+@dataclass(frozen=True)
+class _Settings:
+    # Purpose: Immutable snapshot of validated script settings, swapped whole on each update.
+    hash_output_dir: str = ""
+    csv_path: str = ""
+    csv_delimiter: str = ","
+    retry_count: int = 5
+    retry_delay_ms: int = 400
+    hash_algo: str = "sha256"
+    parallel_threshold_bytes: int = 1024 * 1024 * 1024
+
+
+_CFG = _Settings()
+
+_HASH_ALGOS = ("sha256", "blake3", "sha256-tree")
+_TREE_SHARD_SIZE = 1024 * 1024 * 1024
+_HASH_CTOR = hashlib.new
+_CSV_HEADER = [
+    "end_time_iso",
+    "file_path",
+    "file_name",
+    "file_size_bytes",
+    "duration_seconds",
+    "sha256",
+    "hash_algo",
+]
+
 _TAG = "[recording-hash]"
+_READ_CHUNK_SIZE = 8 * 1024 * 1024
+_READ_AHEAD_BUFFERS = 4
+_idle_read_buffers = []
+_idle_read_buffers_lock = threading.Lock()
+
+_in_flight = {}
+
+_csv_fd = None
+_csv_fd_path = ""
+_csv_fd_columns = None
+_csv_fd_lock = threading.Lock()
+
+_watch_stop = None
+_watch_dir = ""
+_watch_changes = {}
+_watch_cond = threading.Condition()
+_WATCH_QUIET_S = 0.25
+# watchfiles yields at least every debounce ms during continuous writes; keep it well under the quiet window.
+_WATCH_DEBOUNCE_MS = 100
+_WATCH_STEP_MS = 50
+_WATCH_POLL_MS = 500
+# Sidecars, CSV and index files share the folder; forget any file that has been idle this long.
+_WATCH_EXPIRE_S = 60.0
+
+_LOG_Q = queue.SimpleQueue()
+_LOG_STOP = object()
+_log_thread = None
 
 # End section: runtime settings and shared state
 
@@ -32,8 +106,52 @@ _TAG = "[recording-hash]"
 # Logging helper
 # -----------------------------
 def _log(level, msg):
-    # Purpose: Prefix and route script log messages through OBS logging.
-    obs.script_log(level, f"{_TAG} {msg}")
+    # Purpose: Prefix script log messages and queue them for the logger thread (direct call when it is not running).
+    record = (level, f"{_TAG} {msg}")
+    if _log_thread is None:
+        obs.script_log(*record)
+    else:
+        _LOG_Q.put_nowait(record)
+
+
+def _log_loop():
+    # Purpose: Drain queued log records into OBS logging until the stop sentinel arrives.
+    while True:
+        record = _LOG_Q.get()
+        if record is _LOG_STOP:
+            return
+        try:
+            obs.script_log(*record)
+        except Exception:
+            pass
+
+
+def _start_log_thread():
+    # Purpose: Start the single logger thread so worker threads never block on OBS's logging lock.
+    global _log_thread
+    if _log_thread is not None:
+        return
+    t = threading.Thread(target=_log_loop, daemon=True)
+    t.start()
+    _log_thread = t
+
+
+def _stop_log_thread():
+    # Purpose: Stop the logger thread and flush any records queued after the sentinel directly.
+    global _log_thread
+    t = _log_thread
+    if t is None:
+        return
+    _log_thread = None
+    _LOG_Q.put_nowait(_LOG_STOP)
+    t.join(timeout=2.0)
+    while True:
+        try:
+            record = _LOG_Q.get_nowait()
+        except queue.Empty:
+            break
+        if record is not _LOG_STOP:
+            obs.script_log(*record)
 
 # End section: logging helper
 
@@ -43,7 +161,7 @@ def _log(level, msg):
 # -----------------------------
 def script_description():
     # Purpose: Describe this script in the OBS Scripts panel.
-    return "Generate SHA-256 sidecar files and CSV logs for completed OBS recordings."
+    return "Generate SHA-256 (or BLAKE3) sidecar files and CSV logs for completed OBS recordings."
 
 
 def script_defaults(settings):
@@ -53,10 +171,12 @@ def script_defaults(settings):
     obs.obs_data_set_default_string(settings, "csv_delimiter", ",")
     obs.obs_data_set_default_int(settings, "retry_count", 5)
     obs.obs_data_set_default_int(settings, "retry_delay_ms", 400)
+    obs.obs_data_set_default_string(settings, "hash_algo", "sha256")
+    obs.obs_data_set_default_int(settings, "parallel_threshold_mib", 1024)
 
 
 def script_properties():
-    # Purpose: Build the OBS properties UI for output, CSV, and retry options.
+    # Purpose: Build the OBS properties UI for output, CSV, hash, and retry options.
     props = obs.obs_properties_create()
     obs.obs_properties_add_path(
         props,
@@ -83,6 +203,24 @@ def script_properties():
     )
     obs.obs_property_list_add_string(p, "Comma (,)", ",")
     obs.obs_property_list_add_string(p, "Semicolon (;)", ";")
+    p = obs.obs_properties_add_list(
+        props,
+        "hash_algo",
+        "Hash algorithm",
+        obs.OBS_COMBO_TYPE_LIST,
+        obs.OBS_COMBO_FORMAT_STRING,
+    )
+    obs.obs_property_list_add_string(p, "SHA-256", "sha256")
+    obs.obs_property_list_add_string(p, "BLAKE3 (requires blake3 package)", "blake3")
+    obs.obs_property_list_add_string(p, "SHA-256 tree (1 GiB shards, multi-threaded)", "sha256-tree")
+    obs.obs_properties_add_int(
+        props,
+        "parallel_threshold_mib",
+        "Multi-threaded BLAKE3 from size (MiB)",
+        1,
+        1024 * 1024,
+        64,
+    )
     obs.obs_properties_add_int(props, "retry_count", "Retry count", 1, 50, 1)
     obs.obs_properties_add_int(props, "retry_delay_ms", "Retry delay (ms)", 0, 5000, 50)
     return props
@@ -90,11 +228,14 @@ def script_properties():
 
 def script_update(settings):
     # Purpose: Validate and apply settings from the OBS properties UI.
+    global _CFG
     hash_output_dir = _clean_path(obs.obs_data_get_string(settings, "hash_output_dir"))
     csv_path = _clean_path(obs.obs_data_get_string(settings, "csv_path"))
     delimiter = obs.obs_data_get_string(settings, "csv_delimiter")
     retry_count = int(obs.obs_data_get_int(settings, "retry_count"))
     retry_delay_ms = int(obs.obs_data_get_int(settings, "retry_delay_ms"))
+    hash_algo = obs.obs_data_get_string(settings, "hash_algo")
+    parallel_threshold_mib = int(obs.obs_data_get_int(settings, "parallel_threshold_mib"))
 
     if delimiter not in (",", ";"):
         _log(obs.LOG_WARNING, "CSV delimiter invalid; defaulting to comma.")
@@ -108,14 +249,30 @@ def script_update(settings):
         _log(obs.LOG_WARNING, "Retry delay invalid; defaulting to 400 ms.")
         retry_delay_ms = 400
 
-    _SETTINGS["hash_output_dir"] = hash_output_dir
-    _SETTINGS["csv_path"] = csv_path
-    _SETTINGS["csv_delimiter"] = delimiter
-    _SETTINGS["retry_count"] = retry_count
-    _SETTINGS["retry_delay_ms"] = retry_delay_ms
-
-    if csv_path:
-        _reload_seen_paths_from(csv_path)
+    if hash_algo not in _HASH_ALGOS:
+        _log(obs.LOG_WARNING, "Hash algorithm invalid; defaulting to SHA-256.")
+        hash_algo = "sha256"
+
+    if hash_algo == "blake3" and blake3 is None:
+        _log(obs.LOG_WARNING, "blake3 package not installed; falling back to SHA-256.")
+        hash_algo = "sha256"
+
+    if parallel_threshold_mib < 1:
+        _log(obs.LOG_WARNING, "Parallel hash threshold invalid; defaulting to 1024 MiB.")
+        parallel_threshold_mib = 1024
+
+    previous_csv_path = _CFG.csv_path
+    _CFG = _Settings(
+        hash_output_dir=hash_output_dir,
+        csv_path=csv_path,
+        csv_delimiter=delimiter,
+        retry_count=retry_count,
+        retry_delay_ms=retry_delay_ms,
+        hash_algo=hash_algo,
+        parallel_threshold_bytes=parallel_threshold_mib * 1024 * 1024,
+    )
+    if csv_path != previous_csv_path:
+        _close_csv_fd()
 
 # End section: OBS script metadata and UI
 
@@ -125,6 +282,7 @@ def script_update(settings):
 # -----------------------------
 def script_load(settings):
     # Purpose: Register frontend callback when the script is loaded.
+    _start_log_thread()
     obs.obs_frontend_add_event_callback(_on_frontend_event)
     _log(obs.LOG_INFO, "Loaded and listening for recording stop events.")
 
@@ -132,7 +290,10 @@ def script_load(settings):
 def script_unload():
     # Purpose: Unregister frontend callback when the script is unloaded.
     obs.obs_frontend_remove_event_callback(_on_frontend_event)
+    _stop_recording_watch()
+    _close_csv_fd()
     _log(obs.LOG_INFO, "Unloaded.")
+    _stop_log_thread()
 
 # End section: OBS lifecycle registration
 
@@ -141,13 +302,18 @@ def script_unload():
 # Event handling and async kickoff
 # -----------------------------
 def _on_frontend_event(event):
-    # Purpose: React to recording-stopped events and launch background processing.
+    # Purpose: Watch the output folder while recording and launch background processing on stop.
+    if event == obs.OBS_FRONTEND_EVENT_RECORDING_STARTED:
+        _start_recording_watch()
+        return
+
     if event != obs.OBS_FRONTEND_EVENT_RECORDING_STOPPED:
         return
 
     end_time_iso = _now_iso()
     duration_seconds = _get_recording_duration_seconds()
     recording_path = _resolve_last_recording_path()
+    output_closed = _recording_output_closed()
 
     if not recording_path:
         _log(obs.LOG_ERROR, "Recording stopped but file path could not be resolved.")
@@ -155,7 +321,7 @@ def _on_frontend_event(event):
 
     t = threading.Thread(
         target=_process_recording,
-        args=(recording_path, end_time_iso, duration_seconds),
+        args=(recording_path, end_time_iso, duration_seconds, output_closed),
         daemon=True,
     )
     t.start()
@@ -166,48 +332,77 @@ def _on_frontend_event(event):
 # -----------------------------
 # Main recording processing pipeline
 # -----------------------------
-def _process_recording(path, end_time_iso, duration_seconds):
-    # Purpose: Wait, hash, write sidecar, and append CSV for one recording.
+def _process_recording(path, end_time_iso, duration_seconds, output_closed=False):
+    # Purpose: Claim a recording path so concurrent stop events for it are processed only once.
     abs_path = _to_abs_path(path)
     if not abs_path:
         _log(obs.LOG_ERROR, "Resolved recording path is empty.")
         return
 
-    norm_path = os.path.normcase(abs_path)
-    with _seen_lock:
-        if norm_path in _seen_paths:
-            _log(obs.LOG_INFO, f"Skipping duplicate entry for {abs_path}")
-            return
+    norm_path = _normcase(abs_path)
+    token = object()
+    if _in_flight.setdefault(norm_path, token) is not token:
+        _log(obs.LOG_INFO, f"Already processing {abs_path}")
+        return
+    try:
+        _process_claimed_recording(
+            _CFG, abs_path, norm_path, end_time_iso, duration_seconds, output_closed
+        )
+    finally:
+        _forget_watch_changes(norm_path)
+        _in_flight.pop(norm_path, None)
 
-    ok, size_bytes = _wait_for_stable_file(
-        abs_path, _SETTINGS["retry_count"], _SETTINGS["retry_delay_ms"]
-    )
+
+def _process_claimed_recording(
+    cfg, abs_path, norm_path, end_time_iso, duration_seconds, output_closed
+):
+    # Purpose: Wait, hash, write sidecar, and append CSV for one recording.
+    csv_path = _resolve_csv_path(cfg, abs_path)
+    if csv_path and _is_recorded(csv_path, norm_path, cfg.csv_delimiter):
+        _log(obs.LOG_INFO, f"Skipping duplicate entry for {abs_path}")
+        return
+
+    retry_count = cfg.retry_count
+    retry_delay_ms = cfg.retry_delay_ms
+    ok = False
+    size_bytes = 0
+    if output_closed:
+        ok, size_bytes = _read_ready_size(abs_path)
+    if not ok and _wait_for_write_quiet(abs_path, 2 * retry_count * retry_delay_ms / 1000.0):
+        ok, size_bytes = _read_ready_size(abs_path)
+    if not ok:
+        ok, size_bytes = _wait_for_stable_file(abs_path, retry_count, retry_delay_ms)
     if not ok:
         _log(obs.LOG_ERROR, f"File not ready after retries: {abs_path}")
         return
 
-    sha256_hex = _hash_file_with_retries(
-        abs_path, _SETTINGS["retry_count"], _SETTINGS["retry_delay_ms"]
+    hash_algo = cfg.hash_algo
+    parallel = hash_algo == "blake3" and size_bytes >= cfg.parallel_threshold_bytes
+    digest_hex, shard_digests = _hash_file_with_retries(
+        abs_path, hash_algo, parallel, retry_count, retry_delay_ms
     )
-    if not sha256_hex:
+    if not digest_hex:
         _log(obs.LOG_ERROR, f"Failed to hash file after retries: {abs_path}")
         return
 
-    output_dir = _resolve_hash_output_dir(abs_path)
+    output_dir = _resolve_hash_output_dir(cfg, abs_path)
     if not output_dir:
         _log(obs.LOG_ERROR, "Hash output directory could not be resolved.")
         return
 
-    if not _write_sidecar(output_dir, abs_path, sha256_hex):
+    header = _sidecar_header(hash_algo, parallel, shard_digests)
+    if not _write_sidecar(output_dir, abs_path, digest_hex, hash_algo, header):
         _log(obs.LOG_WARNING, f"Failed to write sidecar for {abs_path}")
 
     _append_csv_row(
+        cfg=cfg,
         end_time_iso=end_time_iso,
         file_path=abs_path,
         file_name=os.path.basename(abs_path),
         file_size_bytes=size_bytes,
         duration_seconds=duration_seconds,
-        sha256=sha256_hex,
+        digest=digest_hex,
+        hash_algo=hash_algo,
     )
 
 # End section: main recording processing pipeline
@@ -227,6 +422,23 @@ def _resolve_last_recording_path():
     if path:
         return path
 
+    dir_or_path, ext_hint = _recording_output_location()
+    if not dir_or_path:
+        return ""
+
+    if os.path.isfile(dir_or_path):
+        return dir_or_path
+
+    if os.path.isdir(dir_or_path):
+        candidate = _find_latest_file(dir_or_path, ext_hint)
+        if candidate:
+            return candidate
+
+    return dir_or_path
+
+
+def _recording_output_location():
+    # Purpose: Read the configured path (file or folder) and format hint from the recording output.
     output = None
     try:
         output = obs.obs_frontend_get_recording_output()
@@ -234,12 +446,12 @@ def _resolve_last_recording_path():
         output = None
 
     if not output:
-        return ""
+        return "", ""
 
+    dir_or_path = ""
+    ext_hint = ""
     try:
         settings = obs.obs_output_get_settings(output)
-        dir_or_path = ""
-        ext_hint = ""
         if settings:
             dir_or_path = _first_string(
                 settings, ["path", "directory", "rec_path", "recording_path"]
@@ -251,18 +463,26 @@ def _resolve_last_recording_path():
     finally:
         obs.obs_output_release(output)
 
-    if not dir_or_path:
-        return ""
+    return dir_or_path, ext_hint
 
-    if os.path.isfile(dir_or_path):
-        return dir_or_path
 
-    if os.path.isdir(dir_or_path):
-        candidate = _find_latest_file(dir_or_path, ext_hint)
-        if candidate:
-            return candidate
+def _recording_output_closed():
+    # Purpose: Report whether OBS's recording output is inactive, meaning the muxer has closed the file.
+    output = None
+    try:
+        output = obs.obs_frontend_get_recording_output()
+    except Exception:
+        output = None
 
-    return dir_or_path
+    if not output:
+        return False
+
+    try:
+        return not obs.obs_output_active(output)
+    except Exception:
+        return False
+    finally:
+        obs.obs_output_release(output)
 
 
 def _first_string(obs_data, keys):
@@ -280,28 +500,164 @@ def _first_string(obs_data, keys):
 def _find_latest_file(directory, ext_hint):
     # Purpose: Select the most recently modified file in a directory, optionally by extension.
     try:
-        files = []
-        ext = (ext_hint or "").lstrip(".").lower()
-        for name in os.listdir(directory):
-            path = os.path.join(directory, name)
-            if not os.path.isfile(path):
-                continue
-            if ext and not name.lower().endswith("." + ext):
-                continue
-            files.append(path)
-        if not files:
-            return ""
-        files.sort(key=lambda p: os.path.getmtime(p), reverse=True)
-        return files[0]
+        suffix = "." + (ext_hint or "").lstrip(".").lower()
+        best_mtime = None
+        best_path = ""
+        with os.scandir(directory) as it:
+            for entry in it:
+                if suffix != "." and not entry.name.lower().endswith(suffix):
+                    continue
+                if not entry.is_file():
+                    continue
+                mtime = entry.stat().st_mtime
+                if best_mtime is None or mtime > best_mtime:
+                    best_mtime = mtime
+                    best_path = entry.path
+        return best_path
     except Exception:
         return ""
 
 # End section: recording-path resolution helpers
 
 
+# -----------------------------
+# Recording folder watch helpers
+# -----------------------------
+def _start_recording_watch():
+    # Purpose: Start watching the recording folder for writes so stop handling can skip size polling.
+    global _watch_stop, _watch_dir
+    if watchfiles is not None:
+        loop = _watch_loop
+    elif inotify_simple is not None:
+        loop = _inotify_watch_loop
+    else:
+        return
+
+    dir_or_path, _ext = _recording_output_location()
+    directory = dir_or_path if os.path.isdir(dir_or_path) else os.path.dirname(dir_or_path)
+    if not directory or not os.path.isdir(directory):
+        return
+
+    directory = _to_abs_path(directory)
+    if _watch_stop is not None and os.path.normcase(directory) == os.path.normcase(_watch_dir):
+        return
+
+    _stop_recording_watch()
+    stop_event = threading.Event()
+    _watch_stop = stop_event
+    _watch_dir = directory
+    t = threading.Thread(target=loop, args=(directory, stop_event), daemon=True)
+    t.start()
+
+
+def _stop_recording_watch():
+    # Purpose: Stop the active recording folder watcher, if any.
+    global _watch_stop, _watch_dir
+    if _watch_stop is not None:
+        _watch_stop.set()
+    _watch_stop = None
+    _watch_dir = ""
+    with _watch_cond:
+        _watch_changes.clear()
+
+
+def _watch_loop(directory, stop_event):
+    # Purpose: Record the time of the latest write event for each file in the watched folder.
+    try:
+        for changes in watchfiles.watch(
+            directory,
+            stop_event=stop_event,
+            recursive=False,
+            debounce=_WATCH_DEBOUNCE_MS,
+            step=_WATCH_STEP_MS,
+        ):
+            now = time.monotonic()
+            with _watch_cond:
+                for change, changed_path in changes:
+                    if change != watchfiles.Change.deleted:
+                        _watch_changes[os.path.normcase(changed_path)] = now
+                _prune_watch_changes(now)
+                _watch_cond.notify_all()
+    except Exception as e:
+        _log(obs.LOG_WARNING, f"Recording folder watch stopped: {e}")
+
+
+def _inotify_watch_loop(directory, stop_event):
+    # Purpose: inotify fallback for _watch_loop; a close after writing marks the file quiet at once.
+    flags = inotify_simple.flags
+    mask = flags.MODIFY | flags.CLOSE_WRITE | flags.CREATE | flags.MOVED_TO
+    try:
+        with inotify_simple.INotify() as ino:
+            ino.add_watch(directory, mask)
+            while not stop_event.is_set():
+                events = ino.read(timeout=_WATCH_POLL_MS)
+                if not events:
+                    continue
+                now = time.monotonic()
+                with _watch_cond:
+                    for event in events:
+                        if not event.name:
+                            continue
+                        key = os.path.normcase(os.path.join(directory, event.name))
+                        if event.mask & flags.CLOSE_WRITE:
+                            _watch_changes[key] = now - _WATCH_QUIET_S
+                        else:
+                            _watch_changes[key] = now
+                    _prune_watch_changes(now)
+                    _watch_cond.notify_all()
+    except Exception as e:
+        _log(obs.LOG_WARNING, f"Recording folder watch stopped: {e}")
+
+
+def _prune_watch_changes(now):
+    # Purpose: Drop files idle for longer than _WATCH_EXPIRE_S; caller must hold _watch_cond.
+    stale = [k for k, last in _watch_changes.items() if now - last > _WATCH_EXPIRE_S]
+    for k in stale:
+        del _watch_changes[k]
+
+
+def _forget_watch_changes(norm_path):
+    # Purpose: Drop a processed recording's write history so the change map does not grow all session.
+    with _watch_cond:
+        _watch_changes.pop(os.path.normcase(norm_path), None)
+
+
+def _wait_for_write_quiet(path, timeout_s):
+    # Purpose: Wait until the watcher has seen no writes to a file for a short quiet window.
+    watch_dir = _watch_dir
+    if not watch_dir or os.path.normcase(os.path.dirname(path)) != os.path.normcase(watch_dir):
+        return False
+
+    norm_path = os.path.normcase(path)
+    deadline = time.monotonic() + timeout_s
+    with _watch_cond:
+        while True:
+            last = _watch_changes.get(norm_path)
+            if last is None:
+                return False
+            now = time.monotonic()
+            quiet_left = last + _WATCH_QUIET_S - now
+            if quiet_left <= 0:
+                return True
+            if now >= deadline:
+                return False
+            _watch_cond.wait(min(quiet_left, deadline - now))
+
+# End section: recording folder watch helpers
+
+
 # -----------------------------
 # File readiness and hashing helpers
 # -----------------------------
+def _read_ready_size(path):
+    # Purpose: Read a file's size once, treating a missing or empty file as not ready.
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return False, 0
+    return size > 0, size
+
+
 def _wait_for_stable_file(path, retries, delay_ms):
     # Purpose: Wait until file size stabilizes so hashing starts after writes complete.
     delay = max(0, delay_ms) / 1000.0
@@ -324,121 +680,443 @@ def _wait_for_stable_file(path, retries, delay_ms):
     return False, 0
 
 
-def _hash_file_with_retries(path, retries, delay_ms):
+def _hash_file_with_retries(path, algo, parallel, retries, delay_ms):
     # Purpose: Hash a file with retry behavior to tolerate transient access errors.
     delay = max(0, delay_ms) / 1000.0
     for attempt in range(retries):
         try:
-            return _hash_file(path)
+            if algo == "sha256-tree":
+                return _hash_tree(path)
+            return _hash_file(path, algo, parallel), ()
         except OSError as e:
             _log(obs.LOG_WARNING, f"Hash attempt {attempt + 1} failed: {e}")
             time.sleep(delay)
         except Exception as e:
             _log(obs.LOG_ERROR, f"Unexpected hash error: {e}")
             time.sleep(delay)
-    return ""
+    return "", ()
+
+
+def _new_hasher(algo, parallel=False):
+    # Purpose: Create a fresh hash object for the configured algorithm.
+    if algo == "blake3":
+        return blake3.blake3(max_threads=blake3.blake3.AUTO if parallel else 1)
+    # File-integrity checksum, not message authentication: skip FIPS-only code paths.
+    return _HASH_CTOR("sha256", usedforsecurity=False)
+
+
+def _hash_file(path, algo, parallel=False):
+    # Purpose: Compute the configured digest, preferring a memory map and falling back to streamed reads.
+    if parallel:
+        # BLAKE3 is a Merkle tree: update_mmap spreads subtrees across all cores.
+        h = _new_hasher(algo, parallel=True)
+        h.update_mmap(path)
+        return h.hexdigest()
+
+    with open(path, "rb", buffering=0) as f:
+        fd = f.fileno()
+        _fadvise(fd, "POSIX_FADV_SEQUENTIAL")
+        try:
+            mm = _map_file(fd)
+            if mm is not None:
+                with mm:
+                    return _hash_mapped(mm, algo)
+            return _hash_streamed(f, algo)
+        finally:
+            _fadvise(fd, "POSIX_FADV_DONTNEED")
+
+
+def _map_file(fd):
+    # Purpose: Map a file read-only, or return None when it cannot be mapped (empty, too large, unsupported).
+    try:
+        return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    except (ValueError, OverflowError, OSError):
+        return None
+
+
+def _hash_mapped(mm, algo):
+    # Purpose: Hash a mapped file through zero-copy memoryview slices.
+    _madvise(mm, "MADV_SEQUENTIAL")
+    with memoryview(mm) as mv:
+        digest = _hash_view(mv, algo)
+    _madvise(mm, "MADV_DONTNEED")
+    return digest
+
+
+def _hash_view(view, algo):
+    # Purpose: Hash a memoryview in read-sized slices so the GIL is released per block.
+    h = _new_hasher(algo)
+    for off in range(0, len(view), _READ_CHUNK_SIZE):
+        h.update(view[off:off + _READ_CHUNK_SIZE])
+    return h.hexdigest()
+
+
+def _hash_tree(path):
+    # Purpose: SHA-256 each fixed-size shard on its own thread; the root is SHA-256 over the shard digests.
+    with open(path, "rb", buffering=0) as f:
+        fd = f.fileno()
+        _fadvise(fd, "POSIX_FADV_SEQUENTIAL")
+        try:
+            mm = _map_file(fd)
+            if mm is None:
+                shards = _hash_tree_streamed(f)
+            else:
+                with mm:
+                    with memoryview(mm) as mv:
+                        offsets = range(0, len(mv), _TREE_SHARD_SIZE)
+                        workers = min(len(offsets), os.cpu_count() or 1)
+                        with ThreadPoolExecutor(max_workers=workers) as pool:
+                            shards = list(pool.map(lambda off: _hash_shard(mv, off), offsets))
+                    _madvise(mm, "MADV_DONTNEED")
+        finally:
+            _fadvise(fd, "POSIX_FADV_DONTNEED")
+
+    root = _new_hasher("sha256")
+    root.update(b"".join(bytes.fromhex(d) for d in shards))
+    return root.hexdigest(), tuple(shards)
+
+
+def _hash_shard(mv, offset):
+    # Purpose: Hash one tree shard of a mapped file.
+    with mv[offset:offset + _TREE_SHARD_SIZE] as shard:
+        return _hash_view(shard, "sha256")
+
+
+def _hash_tree_streamed(f):
+    # Purpose: Hash tree shards sequentially from reads when the file cannot be mapped.
+    buffers = _acquire_read_buffers()
+    try:
+        buf = memoryview(buffers[0])
+        shards = []
+        while True:
+            h = _new_hasher("sha256")
+            remaining = _TREE_SHARD_SIZE
+            while remaining:
+                n = f.readinto(buf[:min(len(buf), remaining)])
+                if not n:
+                    break
+                h.update(buf[:n])
+                remaining -= n
+            if remaining < _TREE_SHARD_SIZE or not shards:
+                shards.append(h.hexdigest())
+            if remaining:
+                return shards
+    finally:
+        _release_read_buffers(buffers)
+
 
+def _hash_streamed(f, algo):
+    # Purpose: Hash an open file while a reader thread keeps the next chunks in flight.
+    h = _new_hasher(algo)
+    free_q = queue.Queue()
+    full_q = queue.Queue()
+    buffers = _acquire_read_buffers()
+    for buf in buffers:
+        free_q.put(buf)
 
-def _hash_file(path):
-    # Purpose: Compute SHA-256 digest for a file using chunked reads.
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
+    reader = threading.Thread(
+        target=_read_chunks, args=(f, free_q, full_q), daemon=True
+    )
+    reader.start()
+    try:
         while True:
-            chunk = f.read(1024 * 1024)
-            if not chunk:
+            item = full_q.get()
+            if item is None:
                 break
-            h.update(chunk)
+            if isinstance(item, Exception):
+                raise item
+            buf, n = item
+            h.update(memoryview(buf)[:n])
+            free_q.put(buf)
+    finally:
+        free_q.put(None)
+        reader.join()
+        _release_read_buffers(buffers)
     return h.hexdigest()
 
+
+def _acquire_read_buffers():
+    # Purpose: Take an idle set of read-ahead buffers from the module pool, allocating one if none is free.
+    with _idle_read_buffers_lock:
+        if _idle_read_buffers:
+            return _idle_read_buffers.pop()
+    return [bytearray(_READ_CHUNK_SIZE) for _ in range(_READ_AHEAD_BUFFERS)]
+
+
+def _release_read_buffers(buffers):
+    # Purpose: Return a buffer set so the next recording or retry reuses it, keeping at most one idle set.
+    with _idle_read_buffers_lock:
+        if not _idle_read_buffers:
+            _idle_read_buffers.append(buffers)
+
+
+def _read_chunks(f, free_q, full_q):
+    # Purpose: Fill free buffers from the file and hand them to the hashing thread until EOF.
+    try:
+        while True:
+            buf = free_q.get()
+            if buf is None:
+                return
+            n = f.readinto(buf)
+            if not n:
+                full_q.put(None)
+                return
+            full_q.put((buf, n))
+    except Exception as e:
+        full_q.put(e)
+
+
+def _fadvise(fd, advice_name):
+    # Purpose: Pass a page-cache access hint to the kernel where posix_fadvise exists.
+    advice = getattr(os, advice_name, None)
+    if advice is None or not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
+
+
+def _madvise(mm, advice_name):
+    # Purpose: Pass an access hint for a memory map where madvise exists.
+    advice = getattr(mmap, advice_name, None)
+    if advice is None or not hasattr(mm, "madvise"):
+        return
+    try:
+        mm.madvise(advice)
+    except OSError:
+        pass
+
 # End section: file readiness and hashing helpers
 
 
 # -----------------------------
 # Sidecar and CSV output writers
 # -----------------------------
-def _write_sidecar(output_dir, recording_path, sha256_hex):
-    # Purpose: Persist hash output as a sidecar .sha256 file.
+def _sidecar_header(hash_algo, parallel, shard_digests=()):
+    # Purpose: Describe the algorithm and tree parameters in comment lines that checksum tools skip.
+    if hash_algo == "sha256-tree":
+        lines = [f"# sha256-tree shard_size={_TREE_SHARD_SIZE} shards={len(shard_digests)}"]
+        lines.extend(f"# shard {i} {d}" for i, d in enumerate(shard_digests))
+        return "\n".join(lines)
+    if hash_algo == "blake3":
+        threads = "auto" if parallel else "1"
+        return f"# blake3 chunk_len=1024 max_threads={threads}"
+    return f"# {hash_algo}"
+
+
+def _write_sidecar(output_dir, recording_path, digest_hex, hash_algo, header):
+    # Purpose: Persist hash output as a sidecar file named after the algorithm (.sha256/.blake3).
+    tmp_path = ""
     try:
         os.makedirs(output_dir, exist_ok=True)
         base_name = os.path.basename(recording_path)
-        sidecar_path = os.path.join(output_dir, base_name + ".sha256")
-        with open(sidecar_path, "w", encoding="utf-8") as f:
-            f.write(f"{sha256_hex}  {base_name}\n")
+        sidecar_path = os.path.join(output_dir, base_name + "." + hash_algo)
+        tmp_path = sidecar_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(f"{header}\n{digest_hex}  {base_name}\n")
+        os.replace(tmp_path, sidecar_path)
         _log(obs.LOG_INFO, f"Sidecar written: {sidecar_path}")
         return True
     except Exception as e:
         _log(obs.LOG_ERROR, f"Sidecar write failed: {e}")
+        if tmp_path:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
         return False
 
 
 def _append_csv_row(
+    cfg,
     end_time_iso,
     file_path,
     file_name,
     file_size_bytes,
     duration_seconds,
-    sha256,
+    digest,
+    hash_algo,
 ):
     # Purpose: Append deduplicated recording hash metadata to CSV.
-    csv_path = _resolve_csv_path(file_path)
+    csv_path = _resolve_csv_path(cfg, file_path)
     if not csv_path:
         _log(obs.LOG_ERROR, "CSV path could not be resolved.")
         return False
 
-    _ensure_seen_paths(csv_path)
-
     row = [
         end_time_iso,
         file_path,
         file_name,
         str(file_size_bytes),
         "" if duration_seconds is None else str(duration_seconds),
-        sha256,
+        digest,
+        hash_algo,
     ]
 
-    norm_path = os.path.normcase(file_path)
+    norm_path = _normcase(file_path)
 
-    with _io_lock:
-        with _seen_lock:
-            if norm_path in _seen_paths:
-                _log(obs.LOG_INFO, f"CSV dedupe: {file_path}")
-                return False
-            _seen_paths.add(norm_path)
+    try:
+        os.makedirs(os.path.dirname(csv_path), exist_ok=True)
+    except Exception as e:
+        _log(obs.LOG_ERROR, f"CSV write failed: {e}")
+        return False
 
+    try:
+        conn = _open_index(csv_path, cfg.csv_delimiter)
+    except Exception as e:
+        # The index only deduplicates; losing it must not cost the CSV row itself.
+        _log(obs.LOG_WARNING, f"Dedupe index unavailable, appending without dedupe: {e}")
         try:
-            os.makedirs(os.path.dirname(csv_path), exist_ok=True)
-            is_new = not os.path.exists(csv_path) or os.path.getsize(csv_path) == 0
-            with open(csv_path, "a", encoding="utf-8", newline="") as f:
-                writer = csv.writer(f, delimiter=_SETTINGS["csv_delimiter"])
-                if is_new:
-                    writer.writerow(
-                        [
-                            "end_time_iso",
-                            "file_path",
-                            "file_name",
-                            "file_size_bytes",
-                            "duration_seconds",
-                            "sha256",
-                        ]
-                    )
-                writer.writerow(row)
-            _log(obs.LOG_INFO, f"CSV row written: {csv_path}")
-            return True
+            _append_csv_record(csv_path, row, cfg.csv_delimiter)
         except Exception as e:
             _log(obs.LOG_ERROR, f"CSV write failed: {e}")
-            with _seen_lock:
-                _seen_paths.discard(norm_path)
             return False
+        _log(obs.LOG_INFO, f"CSV row written: {csv_path}")
+        return True
+
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        cur = conn.execute(
+            "INSERT OR IGNORE INTO seen(path, end_time_iso, sha256) VALUES (?, ?, ?)",
+            (norm_path, end_time_iso, digest),
+        )
+        if cur.rowcount == 0:
+            conn.execute("ROLLBACK")
+            _log(obs.LOG_INFO, f"CSV dedupe: {file_path}")
+            return False
+
+        _append_csv_record(csv_path, row, cfg.csv_delimiter)
+        conn.execute("COMMIT")
+        _log(obs.LOG_INFO, f"CSV row written: {csv_path}")
+        return True
+    except Exception as e:
+        _log(obs.LOG_ERROR, f"CSV write failed: {e}")
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        return False
+    finally:
+        conn.close()
+
+
+def _format_csv_record(fields, delimiter):
+    # Purpose: Render one CSV record to UTF-8 bytes so it can be appended with a single write.
+    if len(fields) > 1 and not any(
+        delimiter in f or '"' in f or "\n" in f or "\r" in f for f in fields
+    ):
+        # No field needs quoting: identical to csv.writer's minimal-quoting output.
+        return (delimiter.join(fields) + "\r\n").encode("utf-8")
+    buf = io.StringIO()
+    csv.writer(buf, delimiter=delimiter).writerow(fields)
+    return buf.getvalue().encode("utf-8")
+
+
+def _append_csv_record(csv_path, row, delimiter):
+    # Purpose: Append one record to the cached O_APPEND descriptor under a file lock, shaped to the file's header.
+    global _csv_fd_columns
+    with _csv_fd_lock:
+        fd = _csv_fd_for(csv_path)
+        _lock_fd(fd)
+        try:
+            if os.fstat(fd).st_size == 0:
+                os.write(fd, _format_csv_record(_CSV_HEADER, delimiter))
+                _csv_fd_columns = _CSV_HEADER
+            elif _csv_fd_columns is None:
+                _csv_fd_columns = _read_csv_header(csv_path, delimiter)
+            hash_algo = row[_CSV_HEADER.index("hash_algo")]
+            if "hash_algo" not in _csv_fd_columns and hash_algo != "sha256":
+                # A legacy header's sha256 column would silently hold another algorithm's digest.
+                raise ValueError(
+                    f"{csv_path} predates the hash_algo column; refusing to log a {hash_algo} "
+                    "digest there. Point the CSV setting at a new file or select SHA-256."
+                )
+            os.write(fd, _format_csv_record(_project_row(row, _csv_fd_columns), delimiter))
+        finally:
+            _unlock_fd(fd)
+
+
+def _read_csv_header(csv_path, delimiter):
+    # Purpose: Return the column names of an existing CSV, or the current schema when it has no header.
+    try:
+        with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
+            header = next(csv.reader(f, delimiter=delimiter), None)
+    except OSError:
+        header = None
+    if not header or header[0] != "end_time_iso":
+        return _CSV_HEADER
+    return header
+
+
+def _project_row(row, columns):
+    # Purpose: Reorder a _CSV_HEADER-shaped row to an existing file's columns (older files lack newer ones).
+    if columns is _CSV_HEADER:
+        return row
+    values = dict(zip(_CSV_HEADER, row))
+    return [values.get(name, "") for name in columns]
+
+
+def _csv_fd_for(csv_path):
+    # Purpose: Return the cached append descriptor for a CSV, reopening if the path or file changed.
+    global _csv_fd, _csv_fd_path
+    if _csv_fd is not None and _csv_fd_path == csv_path:
+        try:
+            if os.path.samestat(os.fstat(_csv_fd), os.stat(csv_path)):
+                return _csv_fd
+        except OSError:
+            pass
+
+    _close_csv_fd_locked()
+    flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0)
+    _csv_fd = os.open(csv_path, flags, 0o644)
+    _csv_fd_path = csv_path
+    return _csv_fd
+
+
+def _close_csv_fd():
+    # Purpose: Close the cached CSV append descriptor once no worker is appending through it.
+    with _csv_fd_lock:
+        _close_csv_fd_locked()
+
+
+def _close_csv_fd_locked():
+    # Purpose: Close the cached CSV append descriptor; caller must hold _csv_fd_lock.
+    global _csv_fd, _csv_fd_path, _csv_fd_columns
+    if _csv_fd is not None:
+        try:
+            os.close(_csv_fd)
+        except OSError:
+            pass
+    _csv_fd = None
+    _csv_fd_path = ""
+    _csv_fd_columns = None
+
+
+def _lock_fd(fd):
+    # Purpose: Take an exclusive advisory lock on an open file (flock on POSIX, msvcrt on Windows).
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+    elif msvcrt is not None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+
+def _unlock_fd(fd):
+    # Purpose: Release a lock taken by _lock_fd.
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    elif msvcrt is not None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
 
 # End section: sidecar and CSV output writers
 
 
 # -----------------------------
-# Output path and dedupe preload helpers
+# Output path and dedupe index helpers
 # -----------------------------
-def _resolve_hash_output_dir(recording_path):
+def _resolve_hash_output_dir(cfg, recording_path):
     # Purpose: Resolve where sidecar files should be written.
-    configured = _SETTINGS["hash_output_dir"]
+    configured = cfg.hash_output_dir
     if configured:
         if os.path.isdir(configured):
             return configured
@@ -453,60 +1131,143 @@ def _resolve_hash_output_dir(recording_path):
     return ""
 
 
-def _resolve_csv_path(recording_path):
+def _resolve_csv_path(cfg, recording_path):
     # Purpose: Resolve CSV destination path from settings or recording directory.
-    if _SETTINGS["csv_path"]:
-        return _SETTINGS["csv_path"]
+    if cfg.csv_path:
+        return cfg.csv_path
     rec_dir = os.path.dirname(recording_path)
     if not rec_dir:
         return ""
     return os.path.join(rec_dir, "recording_hashes.csv")
 
 
-def _reload_seen_paths_from(csv_path):
-    # Purpose: Preload already-recorded file paths from CSV for deduplication.
-    global _loaded_csv_path
-    with _seen_lock:
-        _seen_paths.clear()
-        _loaded_csv_path = csv_path
+def _index_path_for(csv_path):
+    # Purpose: Derive the SQLite dedupe index path that sits next to the CSV.
+    return os.path.splitext(csv_path)[0] + ".sqlite3"
 
-    if not csv_path or not os.path.exists(csv_path):
-        return
 
-    delimiter = _SETTINGS["csv_delimiter"]
+def _open_index(csv_path, delimiter):
+    # Purpose: Open the dedupe index for a CSV, reseeding it from the CSV whenever the CSV was replaced or removed.
+    conn = sqlite3.connect(_index_path_for(csv_path), timeout=30, isolation_level=None)
     try:
-        with open(csv_path, "r", encoding="utf-8", newline="") as f:
-            reader = csv.reader(f, delimiter=delimiter)
-            first = True
-            file_path_idx = 1
-            for row in reader:
-                if first:
-                    first = False
-                    if row and row[0] == "end_time_iso":
-                        try:
-                            file_path_idx = row.index("file_path")
-                        except ValueError:
-                            file_path_idx = 1
-                        continue
-                if len(row) > file_path_idx:
-                    p = row[file_path_idx].strip()
-                    if p:
-                        norm = os.path.normcase(_to_abs_path(p))
-                        with _seen_lock:
-                            _seen_paths.add(norm)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if _index_identity(conn) != _csv_identity(csv_path):
+            conn.execute("BEGIN IMMEDIATE")
+            identity = _csv_identity(csv_path)
+            if _index_identity(conn) != identity:
+                _reseed_index(conn, csv_path, delimiter, identity)
+            conn.execute("COMMIT")
+        return conn
+    except Exception:
+        # A failed seed must not leave a partial index marked as matching this CSV.
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        conn.close()
+        raise
+
+
+def _csv_identity(csv_path):
+    # Purpose: Identify the CSV file on disk (device and inode), or "" when it is missing or empty.
+    try:
+        st = os.stat(csv_path)
+    except OSError:
+        return ""
+    if st.st_size == 0:
+        return ""
+    return f"{st.st_dev}:{st.st_ino}"
+
+
+def _index_identity(conn):
+    # Purpose: Return the CSV identity the index was seeded from, or None for a new or legacy index.
+    has_meta = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'meta'"
+    ).fetchone()
+    if has_meta is None:
+        return None
+    row = conn.execute("SELECT value FROM meta WHERE key = 'csv_identity'").fetchone()
+    return None if row is None else row[0]
+
+
+def _reseed_index(conn, csv_path, delimiter, identity):
+    # Purpose: Rebuild the dedupe rows from the CSV's current contents; caller holds the write transaction.
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS seen(path TEXT PRIMARY KEY, end_time_iso TEXT, sha256 TEXT)"
+    )
+    conn.execute("CREATE TABLE IF NOT EXISTS meta(key TEXT PRIMARY KEY, value TEXT)")
+    conn.execute("DELETE FROM seen")
+    conn.executemany(
+        "INSERT OR IGNORE INTO seen(path) VALUES (?)",
+        ((p,) for p in _read_csv_paths(csv_path, delimiter)),
+    )
+    conn.execute(
+        "INSERT OR REPLACE INTO meta(key, value) VALUES ('csv_identity', ?)", (identity,)
+    )
+
+
+def _is_recorded(csv_path, norm_path, delimiter):
+    # Purpose: Look up a normalized recording path in the dedupe index for a CSV.
+    if not os.path.exists(_index_path_for(csv_path)) and not os.path.exists(csv_path):
+        return False
+    try:
+        conn = _open_index(csv_path, delimiter)
+        try:
+            row = conn.execute(
+                "SELECT 1 FROM seen WHERE path = ? LIMIT 1", (norm_path,)
+            ).fetchone()
+        finally:
+            conn.close()
+        return row is not None
     except Exception as e:
-        _log(obs.LOG_WARNING, f"CSV preload failed: {e}")
+        _log(obs.LOG_WARNING, f"Dedupe index lookup failed: {e}")
+        return False
 
 
-def _ensure_seen_paths(csv_path):
-    # Purpose: Ensure deduplication cache matches the currently targeted CSV.
-    if not csv_path:
-        return
-    if _loaded_csv_path == csv_path:
-        return
-    _reload_seen_paths_from(csv_path)
+def _read_csv_paths(csv_path, delimiter):
+    # Purpose: Collect normalized file paths already recorded in a CSV, used to seed the index; raises on read errors.
+    paths = set()
+    if not csv_path or not os.path.exists(csv_path):
+        return paths
+
+    file_path_idx = 1
+
+    def add(fields):
+        if len(fields) > file_path_idx:
+            p = fields[file_path_idx].strip()
+            if p:
+                paths.add(_normcase(p if os.path.isabs(p) else _to_abs_path(p)))
+
+    with open(csv_path, "r", encoding="utf-8", newline="") as f:
+        first = True
+        for line in f:
+            if '"' in line:
+                # Quoted fields may hide delimiters or newlines; let csv parse the rest.
+                for row in csv.reader(itertools.chain([line], f), delimiter=delimiter):
+                    if first:
+                        first = False
+                        if row and row[0] == "end_time_iso":
+                            file_path_idx = _header_index(row, "file_path", 1)
+                            continue
+                    add(row)
+                break
+            if first:
+                first = False
+                header = line.rstrip("\r\n").split(delimiter)
+                if header and header[0] == "end_time_iso":
+                    file_path_idx = _header_index(header, "file_path", 1)
+                    continue
+            add(line.rstrip("\r\n").split(delimiter, file_path_idx + 1))
+    return paths
+
+
+def _header_index(header, name, default):
+    # Purpose: Return a column index from a CSV header row, or a default when absent.
+    try:
+        return header.index(name)
+    except ValueError:
+        return default
 
-# End section: output path and dedupe preload helpers
+# End section: output path and dedupe index helpers
 
 
 # -----------------------------
@@ -525,9 +1286,11 @@ def _get_recording_duration_seconds():
 
 def _now_iso():
     # Purpose: Return current local timestamp in ISO-8601 format.
-    return datetime.datetime.now(datetime.timezone.utc).astimezone().isoformat(
-        timespec="seconds"
-    )
+    now = time.localtime()
+    offset_min = now.tm_gmtoff // 60
+    sign = "+" if offset_min >= 0 else "-"
+    hours, minutes = divmod(abs(offset_min), 60)
+    return time.strftime("%Y-%m-%dT%H:%M:%S", now) + f"{sign}{hours:02d}:{minutes:02d}"
 
 
 def _clean_path(path):
@@ -551,9 +1314,16 @@ def _to_abs_path(path):
     except Exception:
         return path
 
+
+# normcase is the identity on POSIX, so only Windows benefits from memoizing it.
+if os.name == "nt":
+    _normcase = functools.lru_cache(maxsize=65536)(os.path.normcase)
+else:
+    _normcase = os.path.normcase
+
 # End section: time and path normalization helpers
 
 
 # Quick setup/use:
 # - Add this script in OBS (Tools -> Scripts), configure CSV path and optional hash output folder.
-# - Start and stop a recording; a .sha256 sidecar and CSV row are created on stop.
+# - Start and stop a recording; a .sha256 (or .blake3) sidecar and CSV row are created on stop.
@@ -1,19 +1,35 @@
 import obspython as obs
 import os
 import time
+import mmap
 import hashlib
 import shutil
+import queue
 import threading
 import re
 
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
 # -----------------------------
 # Constants and regex patterns
 # -----------------------------
 MAX_RETRIES = 5
 RETRY_DELAY = 1.5
-READ_CHUNK_SIZE = 1024 * 1024
+READ_CHUNK_SIZE = 8 * 1024 * 1024
+MMAP_MIN_SIZE = 64 * 1024 * 1024
+HASH_ALGOS = ("sha256", "blake3")
+HASH_ALGO = "sha256"
+HASH_CTOR = hashlib.new
+
+TIMESTAMP_RE_15 = re.compile(r"\d{8}_\d{6}")
+TIMESTAMP_RE_19 = re.compile(r"\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}")
 
-TIMESTAMP_RE = re.compile(r"^(?:\d{8}_\d{6}|\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})$")
+LOG_QUEUE = queue.SimpleQueue()
+LOG_STOP = object()
+_log_thread = None
 
 # End section: constants and regex patterns
 
@@ -23,7 +39,10 @@ TIMESTAMP_RE = re.compile(r"^(?:\d{8}_\d{6}|\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})
 # -----------------------------
 def script_description():
     # Purpose: Describe this script in the OBS Scripts panel.
-    return "After recording stops, move the file into a new folder and create a SHA-256 sidecar file."
+    return (
+        "After recording stops, move the file into a new folder and create a SHA-256 "
+        "(or BLAKE3) sidecar file."
+    )
 
 # End section: OBS script description
 
@@ -31,14 +50,62 @@ def script_description():
 # -----------------------------
 # Logging helpers
 # -----------------------------
+def emit_log(level, msg):
+    # Purpose: Queue a log record for the logger thread, or write it directly when that thread is not running.
+    if _log_thread is None:
+        obs.script_log(level, msg)
+    else:
+        LOG_QUEUE.put_nowait((level, msg))
+
+
 def log_info(msg):
     # Purpose: Write informational messages to OBS script logs.
-    obs.script_log(obs.LOG_INFO, msg)
+    emit_log(obs.LOG_INFO, msg)
 
 
 def log_error(msg):
     # Purpose: Write error messages to OBS script logs.
-    obs.script_log(obs.LOG_ERROR, msg)
+    emit_log(obs.LOG_ERROR, msg)
+
+
+def log_loop():
+    # Purpose: Drain queued log records into OBS logging until the stop sentinel arrives.
+    while True:
+        record = LOG_QUEUE.get()
+        if record is LOG_STOP:
+            return
+        try:
+            obs.script_log(*record)
+        except Exception:
+            pass
+
+
+def start_log_thread():
+    # Purpose: Start the single logger thread so worker threads never block on OBS's logging lock.
+    global _log_thread
+    if _log_thread is not None:
+        return
+    t = threading.Thread(target=log_loop, daemon=True)
+    t.start()
+    _log_thread = t
+
+
+def stop_log_thread():
+    # Purpose: Stop the logger thread and flush any records queued after the sentinel directly.
+    global _log_thread
+    t = _log_thread
+    if t is None:
+        return
+    _log_thread = None
+    LOG_QUEUE.put_nowait(LOG_STOP)
+    t.join(timeout=2.0)
+    while True:
+        try:
+            record = LOG_QUEUE.get_nowait()
+        except queue.Empty:
+            break
+        if record is not LOG_STOP:
+            obs.script_log(*record)
 
 # End section: logging helpers
 
@@ -48,7 +115,12 @@ def log_error(msg):
 # -----------------------------
 def is_timestamp(name):
     # Purpose: Check whether a folder name already follows the timestamp format.
-    return bool(TIMESTAMP_RE.match(name))
+    n = len(name)
+    if n == 15:
+        return TIMESTAMP_RE_15.fullmatch(name) is not None
+    if n == 19:
+        return TIMESTAMP_RE_19.fullmatch(name) is not None
+    return False
 
 
 def current_timestamp():
@@ -61,30 +133,33 @@ def current_timestamp():
 # -----------------------------
 # Directory and file movement
 # -----------------------------
+def existing_names(parent_dir):
+    # Purpose: Snapshot entry names of a directory (normcase'd) for O(1) collision checks.
+    try:
+        with os.scandir(parent_dir) as it:
+            return {os.path.normcase(entry.name) for entry in it}
+    except OSError:
+        return set()
+
+
 def ensure_unique_folder(parent_dir, base_name):
     # Purpose: Compute a non-conflicting destination folder for the recording.
+    existing = existing_names(parent_dir)
     candidate = base_name
-    target = os.path.join(parent_dir, candidate)
 
-    if os.path.exists(target):
+    if os.path.normcase(candidate) in existing:
         if not is_timestamp(base_name):
             candidate = f"{base_name}_{current_timestamp()}"
         else:
             candidate = f"{base_name}_1"
-        target = os.path.join(parent_dir, candidate)
 
-    if os.path.exists(target):
+    if os.path.normcase(candidate) in existing:
         suffix = 2
-        while True:
-            candidate_try = f"{candidate}_{suffix}"
-            target_try = os.path.join(parent_dir, candidate_try)
-            if not os.path.exists(target_try):
-                candidate = candidate_try
-                target = target_try
-                break
+        while os.path.normcase(f"{candidate}_{suffix}") in existing:
             suffix += 1
+        candidate = f"{candidate}_{suffix}"
 
-    return target
+    return os.path.join(parent_dir, candidate)
 
 
 def move_with_retries(src, dst):
@@ -109,26 +184,99 @@ def move_with_retries(src, dst):
 # -----------------------------
 # Hashing and sidecar output
 # -----------------------------
-def sha256_file(path):
-    # Purpose: Compute SHA-256 hash digest for a file using chunked reads.
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        while True:
-            chunk = f.read(READ_CHUNK_SIZE)
-            if not chunk:
-                break
-            h.update(chunk)
+def new_hasher(algo):
+    # Purpose: Create a fresh hash object for the selected algorithm.
+    if algo == "blake3":
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    # File-integrity checksum, not message authentication: skip FIPS-only code paths.
+    return HASH_CTOR("sha256", usedforsecurity=False)
+
+
+def fadvise(fd, advice_name):
+    # Purpose: Pass a page-cache access hint to the kernel where posix_fadvise exists.
+    advice = getattr(os, advice_name, None)
+    if advice is None or not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
+
+
+def madvise(mm, advice_name):
+    # Purpose: Pass an access hint for a memory map where madvise exists.
+    advice = getattr(mmap, advice_name, None)
+    if advice is None or not hasattr(mm, "madvise"):
+        return
+    try:
+        mm.madvise(advice)
+    except OSError:
+        pass
+
+
+def map_file(fd):
+    # Purpose: Map a file read-only, or return None when it cannot be mapped (empty, too large, unsupported).
+    try:
+        return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    except (ValueError, OverflowError, OSError):
+        return None
+
+
+def hash_file(path, algo):
+    # Purpose: Compute the file digest from a memory map, or with large unbuffered reads as a fallback.
+    h = new_hasher(algo)
+    with open(path, "rb", buffering=0) as f:
+        fd = f.fileno()
+        fadvise(fd, "POSIX_FADV_SEQUENTIAL")
+        try:
+            # Small files hash just as fast through the read buffer; only map large recordings.
+            mm = map_file(fd) if os.fstat(fd).st_size > MMAP_MIN_SIZE else None
+            if mm is not None:
+                with mm:
+                    madvise(mm, "MADV_SEQUENTIAL")
+                    with memoryview(mm) as mv:
+                        for off in range(0, len(mv), READ_CHUNK_SIZE):
+                            h.update(mv[off:off + READ_CHUNK_SIZE])
+                    madvise(mm, "MADV_DONTNEED")
+            else:
+                buf = memoryview(bytearray(READ_CHUNK_SIZE))
+                while True:
+                    n = f.readinto(buf)
+                    if not n:
+                        break
+                    h.update(buf[:n])
+        finally:
+            fadvise(fd, "POSIX_FADV_DONTNEED")
     return h.hexdigest()
 
 
-def write_hash_file(recording_path, digest):
-    # Purpose: Write the SHA-256 sidecar file next to the recording.
-    hash_path = recording_path + ".sha256"
+def write_hash_file(recording_path, digest, algo):
+    # Purpose: Write the digest sidecar file (.sha256/.blake3) next to the recording.
+    hash_path = recording_path + "." + algo
     filename = os.path.basename(recording_path)
-    with open(hash_path, "w", encoding="utf-8") as f:
-        f.write(f"{digest}  {filename}\n")
+    tmp_path = hash_path + ".tmp"
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    try:
+        fd = os.open(tmp_path, flags, 0o644)
+        try:
+            os.write(fd, f"{digest}  {filename}\n".encode("utf-8"))
+        finally:
+            os.close(fd)
+        # Readers see either no sidecar or the complete one, never a partial write.
+        os.replace(tmp_path, hash_path)
+    except Exception:
+        remove_quietly(tmp_path)
+        raise
     return hash_path
 
+
+def remove_quietly(path):
+    # Purpose: Delete a leftover temp file, ignoring a file that is already gone.
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
 # End section: hashing and sidecar output
 
 
@@ -163,11 +311,12 @@ def process_recording(path):
     if not move_with_retries(path, dest_path):
         return
 
+    algo = HASH_ALGO
     try:
-        log_info(f"Hashing recording: {dest_path}")
-        digest = sha256_file(dest_path)
-        hash_path = write_hash_file(dest_path, digest)
-        log_info(f"SHA-256 written: {hash_path}")
+        log_info(f"Hashing recording ({algo}): {dest_path}")
+        digest = hash_file(dest_path, algo)
+        hash_path = write_hash_file(dest_path, digest, algo)
+        log_info(f"Digest written: {hash_path}")
     except Exception as e:
         log_error(f"Failed to hash recording: {e}")
 
@@ -192,6 +341,7 @@ def on_event(event):
 # -----------------------------
 def script_load(settings):
     # Purpose: Register OBS frontend callback when the script loads.
+    start_log_thread()
     obs.obs_frontend_add_event_callback(on_event)
     log_info("SHA-256 recording script loaded.")
 
@@ -199,5 +349,43 @@ def script_load(settings):
 def script_unload():
     # Purpose: Log script unload event for operational visibility.
     log_info("SHA-256 recording script unloaded.")
+    stop_log_thread()
 
 # End section: OBS lifecycle hooks
+
+
+# -----------------------------
+# OBS script settings
+# -----------------------------
+def script_defaults(settings):
+    # Purpose: Set default property values for the hash algorithm choice.
+    obs.obs_data_set_default_string(settings, "hash_algo", "sha256")
+
+
+def script_properties():
+    # Purpose: Build the OBS properties UI for the hash algorithm choice.
+    props = obs.obs_properties_create()
+    p = obs.obs_properties_add_list(
+        props,
+        "hash_algo",
+        "Hash algorithm",
+        obs.OBS_COMBO_TYPE_LIST,
+        obs.OBS_COMBO_FORMAT_STRING,
+    )
+    obs.obs_property_list_add_string(p, "SHA-256", "sha256")
+    obs.obs_property_list_add_string(p, "BLAKE3 (requires blake3 package)", "blake3")
+    return props
+
+
+def script_update(settings):
+    # Purpose: Apply the selected hash algorithm, falling back to SHA-256 when unavailable.
+    global HASH_ALGO
+    algo = obs.obs_data_get_string(settings, "hash_algo")
+    if algo not in HASH_ALGOS:
+        algo = "sha256"
+    if algo == "blake3" and blake3 is None:
+        log_error("blake3 package not installed; falling back to SHA-256.")
+        algo = "sha256"
+    HASH_ALGO = algo
+
+# End section: OBS script settings
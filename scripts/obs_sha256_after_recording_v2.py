@@ -1,24 +1,57 @@
 import obspython as obs
 import os
 import time
+import errno
+import mmap
 import hashlib
 import shutil
+import queue
 import threading
 import re
 import csv
 import platform
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
+try:
+    from cryptography.hazmat.primitives import hashes as crypto_hashes
+except ImportError:
+    crypto_hashes = None
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
 # -----------------------------
 # Constants and schema
 # -----------------------------
 MAX_RETRIES = 5
 RETRY_DELAY = 1.5
-READ_CHUNK_SIZE = 1024 * 1024
-
-TIMESTAMP_RE = re.compile(r"^(?:\d{8}_\d{6}|\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})$")
-
-CSV_FIELDS = [
+MOVE_BACKOFF_START = 0.1
+# Keep retrying a locked move for as long as the old fixed-delay loop did.
+MOVE_RETRY_WINDOW = MAX_RETRIES * RETRY_DELAY
+READ_CHUNK_SIZE = 4 * 1024 * 1024
+READ_BUFFERS = 2
+MMAP_MIN_SIZE = 64 * 1024 * 1024
+CSV_BUFFER_SIZE = 1 << 20
+HASH_ALGOS = ("sha256", "blake3")
+HASH_ALGO = "sha256"
+
+# Reuse a digest left next to the recording by a writer plugin (<recording>.<algo>.partial).
+USE_CACHED_DIGEST = False
+CACHED_DIGEST_SUFFIX = ".partial"
+
+TIMESTAMP_RE_15 = re.compile(r"\d{8}_\d{6}")
+TIMESTAMP_RE_19 = re.compile(r"\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}")
+
+LOG_QUEUE = queue.SimpleQueue()
+LOG_STOP = object()
+_log_thread = None
+_system_info_cache = None
+_src_type_map = None
+
+BASE_FIELDS = (
     "recording_path",
     "recording_filename",
     "recording_folder",
@@ -27,7 +60,8 @@ CSV_FIELDS = [
     "recording_mtime_utc",
     "recording_stop_time_local",
     "recording_stop_time_utc",
-    "recording_hash_sha256",
+    "recording_hash",
+    "recording_hash_algo",
     "recording_hash_file",
     "system_platform",
     "system_os",
@@ -38,9 +72,15 @@ CSV_FIELDS = [
     "python_version",
     "obs_version_string",
     "obs_version_int",
+)
+
+SCENE_FIELDS = (
     "scene_name",
     "scene_snapshot_time_local",
     "scene_snapshot_time_utc",
+)
+
+SRC_FIELDS = (
     "source_name",
     "source_id",
     "source_unversioned_id",
@@ -50,7 +90,10 @@ CSV_FIELDS = [
     "sceneitem_visible",
     "sceneitem_locked",
     "sceneitem_id",
-]
+)
+
+CSV_FIELDS = BASE_FIELDS + SCENE_FIELDS + SRC_FIELDS
+EMPTY_SRC = ("",) * len(SRC_FIELDS)
 
 # End section: constants and schema
 
@@ -61,8 +104,8 @@ CSV_FIELDS = [
 def script_description():
     # Purpose: Describe this script in the OBS Scripts panel.
     return (
-        "After recording stops, move the file into a new folder, create a SHA-256 sidecar "
-        "file, and write a CSV metadata report."
+        "After recording stops, move the file into a new folder, create a SHA-256 "
+        "(or BLAKE3) sidecar file, and write a CSV metadata report."
     )
 
 # End section: OBS script description
@@ -71,14 +114,62 @@ def script_description():
 # -----------------------------
 # Logging helpers
 # -----------------------------
+def emit_log(level, msg):
+    # Purpose: Queue a log record for the logger thread, or write it directly when that thread is not running.
+    if _log_thread is None:
+        obs.script_log(level, msg)
+    else:
+        LOG_QUEUE.put_nowait((level, msg))
+
+
 def log_info(msg):
     # Purpose: Write informational messages to OBS script logs.
-    obs.script_log(obs.LOG_INFO, msg)
+    emit_log(obs.LOG_INFO, msg)
 
 
 def log_error(msg):
     # Purpose: Write error messages to OBS script logs.
-    obs.script_log(obs.LOG_ERROR, msg)
+    emit_log(obs.LOG_ERROR, msg)
+
+
+def log_loop():
+    # Purpose: Drain queued log records into OBS logging until the stop sentinel arrives.
+    while True:
+        record = LOG_QUEUE.get()
+        if record is LOG_STOP:
+            return
+        try:
+            obs.script_log(*record)
+        except Exception:
+            pass
+
+
+def start_log_thread():
+    # Purpose: Start the single logger thread so worker threads never block on OBS's logging lock.
+    global _log_thread
+    if _log_thread is not None:
+        return
+    t = threading.Thread(target=log_loop, daemon=True)
+    t.start()
+    _log_thread = t
+
+
+def stop_log_thread():
+    # Purpose: Stop the logger thread and flush any records queued after the sentinel directly.
+    global _log_thread
+    t = _log_thread
+    if t is None:
+        return
+    _log_thread = None
+    LOG_QUEUE.put_nowait(LOG_STOP)
+    t.join(timeout=2.0)
+    while True:
+        try:
+            record = LOG_QUEUE.get_nowait()
+        except queue.Empty:
+            break
+        if record is not LOG_STOP:
+            obs.script_log(*record)
 
 # End section: logging helpers
 
@@ -88,7 +179,12 @@ def log_error(msg):
 # -----------------------------
 def is_timestamp(name):
     # Purpose: Check whether a folder name already follows the timestamp format.
-    return bool(TIMESTAMP_RE.match(name))
+    n = len(name)
+    if n == 15:
+        return TIMESTAMP_RE_15.fullmatch(name) is not None
+    if n == 19:
+        return TIMESTAMP_RE_19.fullmatch(name) is not None
+    return False
 
 
 def current_timestamp():
@@ -100,6 +196,11 @@ def format_ts(ts, tz):
     # Purpose: Convert a POSIX timestamp to ISO-8601 text in the requested timezone.
     if ts is None:
         return ""
+    # strftime fast paths; output matches datetime.isoformat(timespec="seconds").
+    if tz is None:
+        return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(ts))
+    if tz is timezone.utc:
+        return time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(ts))
     return datetime.fromtimestamp(ts, tz).isoformat(timespec="seconds")
 
 # End section: general utility helpers
@@ -108,47 +209,61 @@ def format_ts(ts, tz):
 # -----------------------------
 # Folder and file move helpers
 # -----------------------------
+def existing_names(parent_dir):
+    # Purpose: Snapshot entry names of a directory (normcase'd) for O(1) collision checks.
+    try:
+        with os.scandir(parent_dir) as it:
+            return {os.path.normcase(entry.name) for entry in it}
+    except OSError:
+        return set()
+
+
 def ensure_unique_folder(parent_dir, base_name):
     # Purpose: Compute a non-conflicting destination folder for the recording.
+    existing = existing_names(parent_dir)
     candidate = base_name
-    target = os.path.join(parent_dir, candidate)
 
-    if os.path.exists(target):
+    if os.path.normcase(candidate) in existing:
         if not is_timestamp(base_name):
             candidate = f"{base_name}_{current_timestamp()}"
         else:
             candidate = f"{base_name}_1"
-        target = os.path.join(parent_dir, candidate)
 
-    if os.path.exists(target):
+    if os.path.normcase(candidate) in existing:
         suffix = 2
-        while True:
-            candidate_try = f"{candidate}_{suffix}"
-            target_try = os.path.join(parent_dir, candidate_try)
-            if not os.path.exists(target_try):
-                candidate = candidate_try
-                target = target_try
-                break
+        while os.path.normcase(f"{candidate}_{suffix}") in existing:
             suffix += 1
+        candidate = f"{candidate}_{suffix}"
 
-    return target
+    return os.path.join(parent_dir, candidate)
 
 
 def move_with_retries(src, dst):
-    # Purpose: Move the recording file with retry logic for transient lock issues.
-    last_err = None
-    for attempt in range(1, MAX_RETRIES + 1):
+    # Purpose: Rename the recording into place, retrying with backoff only while it is locked.
+    delay = MOVE_BACKOFF_START
+    deadline = time.monotonic() + MOVE_RETRY_WINDOW
+    attempt = 0
+    while True:
+        attempt += 1
         try:
-            if not os.path.isfile(src):
-                raise FileNotFoundError(src)
-            shutil.move(src, dst)
+            try:
+                os.replace(src, dst)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.move(src, dst)
             return True
+        except PermissionError as e:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                log_error(f"Failed to move recording after {attempt} attempts: {e}")
+                return False
+            log_info(f"Move attempt {attempt} failed: {e}")
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, RETRY_DELAY)
         except Exception as e:
-            last_err = e
-            log_info(f"Move attempt {attempt}/{MAX_RETRIES} failed: {e}")
-            time.sleep(RETRY_DELAY)
-    log_error(f"Failed to move recording after {MAX_RETRIES} attempts: {last_err}")
-    return False
+            log_error(f"Failed to move recording: {e}")
+            return False
 
 # End section: folder and file move helpers
 
@@ -156,45 +271,236 @@ def move_with_retries(src, dst):
 # -----------------------------
 # Hash helpers
 # -----------------------------
-def sha256_file(path):
-    # Purpose: Compute SHA-256 hash digest for a file using chunked reads.
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
+class CryptographySha256:
+    # Purpose: Adapt cryptography's SHA-256 context to the hashlib update/hexdigest interface.
+    def __init__(self):
+        # Purpose: Create a fresh cryptography SHA-256 hashing context.
+        self._ctx = crypto_hashes.Hash(crypto_hashes.SHA256())
+
+    def update(self, data):
+        # Purpose: Feed the next chunk of bytes into the hashing context.
+        self._ctx.update(data)
+
+    def hexdigest(self):
+        # Purpose: Finalize the context and return the digest as lowercase hex.
+        return self._ctx.finalize().hex()
+
+
+def probe_sha256_ctor():
+    # Purpose: Prefer the cryptography wheel's bundled OpenSSL (SHA-NI dispatch), else hashlib.
+    if crypto_hashes is not None:
+        try:
+            CryptographySha256().update(b"")
+            return CryptographySha256
+        except Exception:
+            pass
+    return hashlib.sha256
+
+
+def new_hasher(algo):
+    # Purpose: Create a fresh hash object for the selected algorithm.
+    if algo == "blake3":
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    return SHA256_CTOR()
+
+
+def fadvise(fd, advice_name):
+    # Purpose: Pass a page-cache access hint to the kernel where posix_fadvise exists.
+    advice = getattr(os, advice_name, None)
+    if advice is None or not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
+
+
+def open_sequential(path):
+    # Purpose: Open a file unbuffered for one sequential pass (O_SEQUENTIAL maps to FILE_FLAG_SEQUENTIAL_SCAN on Windows).
+    flags = os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_SEQUENTIAL", 0)
+    fd = os.open(path, flags)
+    try:
+        return os.fdopen(fd, "rb", buffering=0)
+    except Exception:
+        os.close(fd)
+        raise
+
+
+def madvise(mm, advice_name):
+    # Purpose: Pass an access hint for a memory map where madvise exists.
+    advice = getattr(mmap, advice_name, None)
+    if advice is None or not hasattr(mm, "madvise"):
+        return
+    try:
+        mm.madvise(advice)
+    except OSError:
+        pass
+
+
+def map_file(fd):
+    # Purpose: Map a file read-only, or return None when it cannot be mapped (empty, too large, unsupported).
+    try:
+        return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    except (ValueError, OverflowError, OSError):
+        return None
+
+
+def hash_file(path, algo):
+    # Purpose: Compute the file digest from a memory map, falling back to buffered reads.
+    with open_sequential(path) as f:
+        fd = f.fileno()
+        fadvise(fd, "POSIX_FADV_SEQUENTIAL")
+        try:
+            # Small files hash just as fast through the read buffer; only map large recordings.
+            mm = map_file(fd) if os.fstat(fd).st_size > MMAP_MIN_SIZE else None
+            if mm is not None:
+                h = new_hasher(algo)
+                with mm:
+                    madvise(mm, "MADV_SEQUENTIAL")
+                    with memoryview(mm) as mv:
+                        # Chunked views, not one update, so the GIL is released between blocks.
+                        for off in range(0, len(mv), READ_CHUNK_SIZE):
+                            h.update(mv[off:off + READ_CHUNK_SIZE])
+                return h.hexdigest()
+            return hash_stream(f, algo)
+        finally:
+            fadvise(fd, "POSIX_FADV_DONTNEED")
+
+
+def hash_stream(f, algo):
+    # Purpose: Hash an open file while a reader thread fills the next buffer (double buffering).
+    h = new_hasher(algo)
+    free_q = queue.Queue()
+    full_q = queue.Queue(maxsize=READ_BUFFERS)
+    for _ in range(READ_BUFFERS):
+        free_q.put(bytearray(READ_CHUNK_SIZE))
+
+    reader = threading.Thread(target=read_chunks, args=(f, free_q, full_q), daemon=True)
+    reader.start()
+    try:
         while True:
-            chunk = f.read(READ_CHUNK_SIZE)
-            if not chunk:
+            item = full_q.get()
+            if item is None:
                 break
-            h.update(chunk)
+            if isinstance(item, Exception):
+                raise item
+            buf, n = item
+            h.update(memoryview(buf)[:n])
+            free_q.put(buf)
+    finally:
+        free_q.put(None)
+        reader.join()
     return h.hexdigest()
 
 
-def write_hash_file(recording_path, digest):
-    # Purpose: Write the SHA-256 sidecar file next to the recording.
-    hash_path = recording_path + ".sha256"
+def read_chunks(f, free_q, full_q):
+    # Purpose: Fill free buffers from the file and hand them to the hashing thread until EOF.
+    try:
+        while True:
+            buf = free_q.get()
+            if buf is None:
+                return
+            n = f.readinto(buf)
+            if not n:
+                full_q.put(None)
+                return
+            full_q.put((buf, n))
+    except Exception as e:
+        full_q.put(e)
+
+
+def read_cached_digest(recording_path, algo):
+    # Purpose: Return a precomputed digest from the writer plugin's sidecar, or "" if unusable.
+    try:
+        with open(f"{recording_path}.{algo}{CACHED_DIGEST_SUFFIX}", "r", encoding="utf-8") as f:
+            fields = f.readline().split()
+    except OSError:
+        return ""
+    if not fields:
+        return ""
+    digest = fields[0].lower()
+    if len(digest) != 64 or any(c not in "0123456789abcdef" for c in digest):
+        return ""
+    return digest
+
+
+def write_hash_file(recording_path, digest, algo):
+    # Purpose: Write the digest sidecar file (.sha256/.blake3) next to the recording.
+    hash_path = recording_path + "." + algo
     filename = os.path.basename(recording_path)
-    with open(hash_path, "w", encoding="utf-8") as f:
-        f.write(f"{digest}  {filename}\n")
+    tmp_path = hash_path + ".tmp"
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    try:
+        fd = os.open(tmp_path, flags, 0o644)
+        try:
+            os.write(fd, f"{digest}  {filename}\n".encode("utf-8"))
+        finally:
+            os.close(fd)
+        # Readers see either no sidecar or the complete one, never a partial write.
+        os.replace(tmp_path, hash_path)
+    except Exception:
+        remove_quietly(tmp_path)
+        raise
     return hash_path
 
+
+def remove_quietly(path):
+    # Purpose: Delete a leftover temp file, ignoring a file that is already gone.
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+SHA256_CTOR = probe_sha256_ctor()
+
 # End section: hash helpers
 
 
 # -----------------------------
 # OBS source and environment snapshots
 # -----------------------------
+def get_src_type_map():
+    # Purpose: Build the OBS source type -> label map on first use (constants may be missing at import time).
+    global _src_type_map
+    if _src_type_map is None:
+        mapping = [
+            ("OBS_SOURCE_TYPE_INPUT", "input"),
+            ("OBS_SOURCE_TYPE_FILTER", "filter"),
+            ("OBS_SOURCE_TYPE_TRANSITION", "transition"),
+            ("OBS_SOURCE_TYPE_SCENE", "scene"),
+        ]
+        type_map = {}
+        for const_name, label in mapping:
+            const_val = getattr(obs, const_name, None)
+            if const_val is not None:
+                type_map.setdefault(const_val, label)
+        _src_type_map = type_map
+    return _src_type_map
+
+
 def source_type_to_str(source_type):
     # Purpose: Map OBS source type constants to readable labels.
-    mapping = [
-        ("OBS_SOURCE_TYPE_INPUT", "input"),
-        ("OBS_SOURCE_TYPE_FILTER", "filter"),
-        ("OBS_SOURCE_TYPE_TRANSITION", "transition"),
-        ("OBS_SOURCE_TYPE_SCENE", "scene"),
-    ]
-    for const_name, label in mapping:
-        const_val = getattr(obs, const_name, None)
-        if const_val is not None and source_type == const_val:
-            return label
-    return str(source_type)
+    label = get_src_type_map().get(source_type)
+    return label if label is not None else str(source_type)
+
+
+def processor_name():
+    # Purpose: Read the CPU description cheaply (env var / procfs) instead of spawning helpers.
+    if os.name == "nt":
+        name = os.environ.get("PROCESSOR_IDENTIFIER", "")
+        if name:
+            return name
+    elif os.path.isfile("/proc/cpuinfo"):
+        try:
+            with open("/proc/cpuinfo", "r", encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    key, sep, value = line.partition(":")
+                    if sep and key.strip() == "model name":
+                        return value.strip()
+        except OSError:
+            pass
+    return platform.processor()
 
 
 def snapshot_system_info():
@@ -205,7 +511,7 @@ def snapshot_system_info():
         "system_os_release": platform.release(),
         "system_os_version": platform.version(),
         "system_machine": platform.machine(),
-        "system_processor": platform.processor(),
+        "system_processor": processor_name(),
         "python_version": platform.python_version(),
         "obs_version_string": "",
         "obs_version_int": "",
@@ -240,20 +546,32 @@ def snapshot_scene_sources(snapshot_ts):
         if scene:
             items = obs.obs_scene_enum_items(scene)
             if items:
+                # Bind the per-item OBS calls once; the loop runs for every source in the scene.
+                get_source = obs.obs_sceneitem_get_source
+                get_type = obs.obs_source_get_type
+                get_name = obs.obs_source_get_name
+                get_id = obs.obs_source_get_id
+                get_unversioned_id = obs.obs_source_get_unversioned_id
+                is_active = obs.obs_source_active
+                is_showing = obs.obs_source_showing
+                is_visible = obs.obs_sceneitem_visible
+                is_locked = obs.obs_sceneitem_locked
+                get_item_id = obs.obs_sceneitem_get_id
+                type_to_str = source_type_to_str
+                append = info["sources"].append
                 for item in items:
-                    source = obs.obs_sceneitem_get_source(item)
-                    src_type = obs.obs_source_get_type(source)
-                    info["sources"].append(
+                    source = get_source(item)
+                    append(
                         {
-                            "source_name": obs.obs_source_get_name(source),
-                            "source_id": obs.obs_source_get_id(source),
-                            "source_unversioned_id": obs.obs_source_get_unversioned_id(source),
-                            "source_type": source_type_to_str(src_type),
-                            "source_active": str(bool(obs.obs_source_active(source))),
-                            "source_showing": str(bool(obs.obs_source_showing(source))),
-                            "sceneitem_visible": str(bool(obs.obs_sceneitem_visible(item))),
-                            "sceneitem_locked": str(bool(obs.obs_sceneitem_locked(item))),
-                            "sceneitem_id": str(obs.obs_sceneitem_get_id(item)),
+                            "source_name": get_name(source),
+                            "source_id": get_id(source),
+                            "source_unversioned_id": get_unversioned_id(source),
+                            "source_type": type_to_str(get_type(source)),
+                            "source_active": str(bool(is_active(source))),
+                            "source_showing": str(bool(is_showing(source))),
+                            "sceneitem_visible": str(bool(is_visible(item))),
+                            "sceneitem_locked": str(bool(is_locked(item))),
+                            "sceneitem_id": str(get_item_id(item)),
                         }
                     )
                 obs.sceneitem_list_release(items)
@@ -270,35 +588,26 @@ def snapshot_scene_sources(snapshot_ts):
 # -----------------------------
 def write_metadata_csv(csv_path, recording_info, system_info, scene_info):
     # Purpose: Write normalized recording, system, and scene metadata rows to CSV.
-    rows = []
-    scene_name = scene_info.get("scene_name", "")
-    scene_local = scene_info.get("scene_snapshot_time_local", "")
-    scene_utc = scene_info.get("scene_snapshot_time_utc", "")
+    base = tuple(recording_info.get(k, system_info.get(k, "")) for k in BASE_FIELDS)
+    base += tuple(scene_info.get(k, "") for k in SCENE_FIELDS)
 
     sources = scene_info.get("sources") or []
     if sources:
-        for src in sources:
-            row = {}
-            row.update(recording_info)
-            row.update(system_info)
-            row["scene_name"] = scene_name
-            row["scene_snapshot_time_local"] = scene_local
-            row["scene_snapshot_time_utc"] = scene_utc
-            row.update(src)
-            rows.append(row)
+        rows = [base + tuple(src.get(k, "") for k in SRC_FIELDS) for src in sources]
     else:
-        row = {}
-        row.update(recording_info)
-        row.update(system_info)
-        row["scene_name"] = scene_name
-        row["scene_snapshot_time_local"] = scene_local
-        row["scene_snapshot_time_utc"] = scene_utc
-        rows.append(row)
-
-    with open(csv_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction="ignore")
-        writer.writeheader()
-        writer.writerows(rows)
+        rows = [base + EMPTY_SRC]
+
+    # One large block buffer: the rows go out in a few writes at close, with no per-row flushes.
+    tmp_path = csv_path + ".tmp"
+    try:
+        with open(tmp_path, "w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_FIELDS)
+            writer.writerows(rows)
+        os.replace(tmp_path, csv_path)
+    except Exception:
+        remove_quietly(tmp_path)
+        raise
 
 # End section: metadata CSV writer
 
@@ -330,40 +639,75 @@ def process_recording(path, stop_ts, system_info, scene_info):
 
     dest_path = os.path.join(target_dir, filename)
 
+    algo = HASH_ALGO
+    cached_path = f"{path}.{algo}{CACHED_DIGEST_SUFFIX}"
+    digest = read_cached_digest(path, algo) if USE_CACHED_DIGEST else ""
+    if digest:
+        log_info(f"Using cached digest from: {cached_path}")
+
     log_info(f"Moving recording to: {dest_path}")
     if not move_with_retries(path, dest_path):
         return
 
-    try:
-        log_info(f"Hashing recording: {dest_path}")
-        digest = sha256_file(dest_path)
-        hash_path = write_hash_file(dest_path, digest)
-        log_info(f"SHA-256 written: {hash_path}")
-    except Exception as e:
-        log_error(f"Failed to hash recording: {e}")
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        hash_future = None
+        if not digest:
+            log_info(f"Hashing recording ({algo}): {dest_path}")
+            hash_future = pool.submit(hash_file, dest_path, algo)
+
+        # Metadata depends only on the moved file, not its digest: build it while hashing runs.
+        recording_info = None
+        info_err = None
+        try:
+            recording_info = build_recording_info(dest_path, target_dir, stop_ts)
+        except Exception as e:
+            info_err = e
+
+        try:
+            if hash_future is not None:
+                digest = hash_future.result()
+            hash_path = write_hash_file(dest_path, digest, algo)
+            log_info(f"Digest written: {hash_path}")
+        except Exception as e:
+            log_error(f"Failed to hash recording: {e}")
+            return
+
+    if hash_future is None:
+        # The cached digest now lives in the real sidecar; the .partial would be orphaned.
+        try:
+            os.remove(cached_path)
+        except OSError as e:
+            log_error(f"Failed to remove cached digest '{cached_path}': {e}")
+
+    if info_err is not None:
+        log_error(f"Failed to write metadata CSV: {info_err}")
         return
 
     try:
-        stat = os.stat(dest_path)
-        recording_info = {
-            "recording_path": dest_path,
-            "recording_filename": filename,
-            "recording_folder": target_dir,
-            "recording_size_bytes": str(stat.st_size),
-            "recording_mtime_local": format_ts(stat.st_mtime, None),
-            "recording_mtime_utc": format_ts(stat.st_mtime, timezone.utc),
-            "recording_stop_time_local": format_ts(stop_ts, None),
-            "recording_stop_time_utc": format_ts(stop_ts, timezone.utc),
-            "recording_hash_sha256": digest,
-            "recording_hash_file": hash_path,
-        }
-
+        recording_info["recording_hash"] = digest
+        recording_info["recording_hash_algo"] = algo
+        recording_info["recording_hash_file"] = hash_path
         csv_path = dest_path + ".metadata.csv"
         write_metadata_csv(csv_path, recording_info, system_info, scene_info)
         log_info(f"Metadata CSV written: {csv_path}")
     except Exception as e:
         log_error(f"Failed to write metadata CSV: {e}")
 
+
+def build_recording_info(dest_path, target_dir, stop_ts):
+    # Purpose: Collect the digest-independent recording fields for the metadata CSV.
+    stat = os.stat(dest_path)
+    return {
+        "recording_path": dest_path,
+        "recording_filename": os.path.basename(dest_path),
+        "recording_folder": target_dir,
+        "recording_size_bytes": str(stat.st_size),
+        "recording_mtime_local": format_ts(stat.st_mtime, None),
+        "recording_mtime_utc": format_ts(stat.st_mtime, timezone.utc),
+        "recording_stop_time_local": format_ts(stop_ts, None),
+        "recording_stop_time_utc": format_ts(stop_ts, timezone.utc),
+    }
+
 # End section: recording processing pipeline
 
 
@@ -375,7 +719,9 @@ def on_event(event):
     if event == obs.OBS_FRONTEND_EVENT_RECORDING_STOPPED:
         stop_ts = time.time()
         path = obs.obs_frontend_get_last_recording()
-        system_info = snapshot_system_info()
+        system_info = _system_info_cache
+        if system_info is None:
+            system_info = snapshot_system_info()
         scene_info = snapshot_scene_sources(stop_ts)
         t = threading.Thread(
             target=process_recording,
@@ -392,6 +738,10 @@ def on_event(event):
 # -----------------------------
 def script_load(settings):
     # Purpose: Register OBS frontend callback when the script loads.
+    global _system_info_cache
+    start_log_thread()
+    # Host and OBS version details are fixed for the session; snapshot them once.
+    _system_info_cache = snapshot_system_info()
     obs.obs_frontend_add_event_callback(on_event)
     log_info("SHA-256 + metadata CSV recording script loaded.")
 
@@ -399,5 +749,50 @@ def script_load(settings):
 def script_unload():
     # Purpose: Log script unload event for operational visibility.
     log_info("SHA-256 + metadata CSV recording script unloaded.")
+    stop_log_thread()
 
 # End section: OBS lifecycle hooks
+
+
+# -----------------------------
+# OBS script settings
+# -----------------------------
+def script_defaults(settings):
+    # Purpose: Set default property values for the hash algorithm and cached-digest options.
+    obs.obs_data_set_default_string(settings, "hash_algo", "sha256")
+    obs.obs_data_set_default_bool(settings, "use_cached_digest", False)
+
+
+def script_properties():
+    # Purpose: Build the OBS properties UI for the hash algorithm and cached-digest options.
+    props = obs.obs_properties_create()
+    p = obs.obs_properties_add_list(
+        props,
+        "hash_algo",
+        "Hash algorithm",
+        obs.OBS_COMBO_TYPE_LIST,
+        obs.OBS_COMBO_FORMAT_STRING,
+    )
+    obs.obs_property_list_add_string(p, "SHA-256", "sha256")
+    obs.obs_property_list_add_string(p, "BLAKE3 (requires blake3 package)", "blake3")
+    obs.obs_properties_add_bool(
+        props,
+        "use_cached_digest",
+        "Reuse writer-supplied digest (<recording>.<algo>.partial)",
+    )
+    return props
+
+
+def script_update(settings):
+    # Purpose: Apply the selected hash algorithm (falling back to SHA-256) and cached-digest option.
+    global HASH_ALGO, USE_CACHED_DIGEST
+    USE_CACHED_DIGEST = obs.obs_data_get_bool(settings, "use_cached_digest")
+    algo = obs.obs_data_get_string(settings, "hash_algo")
+    if algo not in HASH_ALGOS:
+        algo = "sha256"
+    if algo == "blake3" and blake3 is None:
+        log_error("blake3 package not installed; falling back to SHA-256.")
+        algo = "sha256"
+    HASH_ALGO = algo
+
+# End section: OBS script settings